@@ -88,6 +88,7 @@ from quiz.entity.entity import (
     QuestionCategory,
     SessionQuestion,
 )
+from quiz.util.encoder import OrjsonProvider
 
 from quiz.controller.image_controller import image_routes
 
@@ -101,6 +102,9 @@ app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = True
 app.config["SECRET_KEY"] = SECRET_KEY
 app.config["SESSION_COOKIE_NAME"] = "mimi_session"
 
+# Serialize JSON responses and the tojson filter with orjson
+app.json = OrjsonProvider(app)
+
 # Init Databases
 db.init_app(app)
 
@@ -45,7 +45,7 @@ class Network(db.Model):  # type:ignore[name-defined]
     id = db.Column(db.Integer, primary_key=True)
     author_id = db.Column(db.Integer, db.ForeignKey("user.id"), nullable=False)
 
-    guid = db.Column(db.String(512), nullable=False)
+    guid = db.Column(db.String(512), nullable=False, index=True)
     title = db.Column(db.String(1024), default="Новая сеть", nullable=False)
 
     description = db.Column(db.String(4096), default="", nullable=True)
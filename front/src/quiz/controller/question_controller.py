@@ -15,7 +15,7 @@ def get_questions_by_section_endpoint():
         abort(res[1])
 
     return make_response(
-        json.dumps([obj.__dict__ for obj in res[0]], cls=UUIDEncoder, default=str),
+        json.dumps([obj.to_dict() for obj in res[0]], cls=UUIDEncoder, default=str),
         res[1],
     )
 
@@ -67,7 +67,7 @@ def get_deleted_sections_by_test_endpoint():
         abort(res[1])
     else:
         return make_response(
-            json.dumps([obj.__dict__ for obj in res[0]], cls=UUIDEncoder), res[1]
+            json.dumps([obj.to_dict() for obj in res[0]], cls=UUIDEncoder), res[1]
         )
 
 
@@ -47,7 +47,7 @@ def get_tests_by_owner_endpoint():
     res = get_tests_by_owner(user)
 
     return make_response(
-        json.dumps([obj.__dict__ for obj in res], cls=UUIDEncoder), 200
+        json.dumps([obj.to_dict() for obj in res], cls=UUIDEncoder), 200
     )
 
 
@@ -70,7 +70,7 @@ def get_deleted_tests_by_owner_endpoint():
     res = get_deleted_tests_by_owner(user)
 
     return make_response(
-        json.dumps([obj.__dict__ for obj in res], cls=UUIDEncoder), 200
+        json.dumps([obj.to_dict() for obj in res], cls=UUIDEncoder), 200
     )
 
 
@@ -115,7 +115,7 @@ def get_tests_by_author_name_endpoint():
     tests = get_tests_by_author_name(request.json["author_name"])
 
     return make_response(
-        json.dumps([obj.__dict__ for obj in tests], cls=UUIDEncoder), 200
+        json.dumps([obj.to_dict() for obj in tests], cls=UUIDEncoder), 200
     )
 
 
@@ -1,5 +1,6 @@
 import json
 import uuid
+from zoneinfo import ZoneInfo
 
 from sqlalchemy import types, func
 from sqlalchemy.dialects.postgresql import UUID
@@ -8,6 +9,8 @@ from sqlalchemy.types import TypeDecorator, CHAR
 
 from miminet_model import db
 
+MOSCOW_TZ = ZoneInfo("Europe/Moscow")
+
 
 class GUID(TypeDecorator):
     impl = CHAR
@@ -136,6 +139,15 @@ class Section(
 
     __table_args__ = (db.Index("section_test_id_is_deleted", "test_id", "is_deleted"),)
 
+    @property
+    def results_available_from_moscow(self):
+        # Naive values are stored in Moscow time.
+        if self.results_available_from is None:
+            return None
+        if self.results_available_from.tzinfo is None:
+            return self.results_available_from.replace(tzinfo=MOSCOW_TZ)
+        return self.results_available_from.astimezone(MOSCOW_TZ)
+
     def __str__(self):
         return self.name
 
@@ -271,6 +283,7 @@ class PracticeQuestion(
     question = db.relationship(
         "Question", uselist=False, back_populates="practice_question"
     )
+    start_network = db.relationship("Network", foreign_keys=[start_configuration])
 
 
 # Table for question categories.
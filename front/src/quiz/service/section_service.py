@@ -1,5 +1,7 @@
 from datetime import datetime
 
+from sqlalchemy.orm import selectinload
+
 from miminet_model import db, User
 from quiz.entity.entity import Section, Test
 from quiz.util.dto import to_section_dto_list
@@ -34,7 +36,11 @@ def get_section(section_id: str):
 
 
 def get_sections_by_test(test_id: str):
-    sections = Section.query.filter_by(test_id=test_id, is_deleted=False).all()
+    sections = (
+        Section.query.options(selectinload(Section.test))  # type: ignore[arg-type]
+        .filter_by(test_id=test_id, is_deleted=False)
+        .all()
+    )
     if sections is None:
         return None, 404
 
@@ -47,7 +53,11 @@ def get_deleted_sections_by_test(test_id: str, user: User):
         return None, 404
     elif test.created_by_id != user.id:
         return None, 403
-    deleted_sections = Section.query.filter_by(test_id=test_id, is_deleted=True).all()
+    deleted_sections = (
+        Section.query.options(selectinload(Section.test))  # type: ignore[arg-type]
+        .filter_by(test_id=test_id, is_deleted=True)
+        .all()
+    )
     section_dtos = to_section_dto_list(deleted_sections)
 
     return section_dtos, 200
@@ -1,15 +1,17 @@
 import json
 import logging
 from markupsafe import Markup
+from sqlalchemy.orm import joinedload, selectinload
 from datetime import datetime
-from zoneinfo import ZoneInfo
 
 from miminet_model import User, Network, db
 from quiz.service.check_practice_service import check_task
 from quiz.entity.entity import (
+    MOSCOW_TZ,
     SessionQuestion,
     Answer,
     PracticeQuestion,
+    Question,
 )
 from quiz.util.dto import (
     QuestionDto,
@@ -18,31 +20,31 @@ from quiz.util.dto import (
     calculate_max_score,
 )
 
-MOSCOW_TZ = ZoneInfo("Europe/Moscow")
-
 
 def is_answer_available(section):
     available_answer = True
     if section and section.results_available_from:
         now_moscow = datetime.now(MOSCOW_TZ)
-
-        if section.results_available_from.tzinfo is None:
-            results_time = section.results_available_from.replace(tzinfo=MOSCOW_TZ)
-        else:
-            results_time = section.results_available_from.astimezone(MOSCOW_TZ)
-
-        available_answer = results_time <= now_moscow
+        available_answer = section.results_available_from_moscow <= now_moscow
 
     return available_answer
 
 
 def get_question_by_session_question_id(session_question_id: str):
-    session_question = SessionQuestion.query.filter_by(id=session_question_id).first()
+    session_question = db.session.get(SessionQuestion, session_question_id)
 
     if session_question is None:
         return 404
 
-    question = session_question.question
+    question = (
+        Question.query.options(
+            selectinload(Question.answers),  # type: ignore[arg-type]
+            selectinload(Question.images),  # type: ignore[arg-type]
+            joinedload(Question.practice_question),  # type: ignore[arg-type]
+        )
+        .filter_by(id=session_question.question_id)
+        .first()
+    )
 
     if question is None or question.is_deleted:
         return 404
@@ -58,8 +60,13 @@ def get_question_by_session_question_id(session_question_id: str):
     available_answer = is_answer_available(section)
     session_question_id = session_question.id
 
+    question_dto = QuestionDto(
+        session_question.created_by_id, question, session_question.id
+    )
+    db.session.commit()
+
     return (
-        QuestionDto(session_question.created_by_id, question, session_question.id),
+        question_dto,
         is_exam,
         timer,
         available_answer,
@@ -1,16 +1,19 @@
 import random
 import uuid
-from typing import List
-import json
+from dataclasses import dataclass
+from typing import Any, List, Optional
+
+import orjson
 
 from datetime import datetime
-from zoneinfo import ZoneInfo
 
 from flask_login import current_user
 from markupsafe import Markup
+from sqlalchemy import and_, case, func, or_
 
 from miminet_model import Network, db
 from quiz.entity.entity import (
+    MOSCOW_TZ,
     Section,
     Test,
     Question,
@@ -23,88 +26,159 @@ from quiz.entity.entity import (
 def calculate_question_count(section: Section) -> int:
     if section.meta_description:
         try:
-            meta_data = json.loads(section.meta_description)
+            meta_data = orjson.loads(section.meta_description)
             return sum(meta_data.values())
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             return 0
     return len(section.questions)
 
 
-MOSCOW_TZ = ZoneInfo("Europe/Moscow")
-
-
-def is_answer_available(section):
+def is_answer_available(section, now_moscow: datetime):
     available_answer = True
     if section and section.results_available_from:
-        now_moscow = datetime.now(MOSCOW_TZ)
+        available_answer = section.results_available_from_moscow <= now_moscow
 
-        if section.results_available_from.tzinfo is None:
-            results_time = section.results_available_from.replace(tzinfo=MOSCOW_TZ)
-        else:
-            results_time = section.results_available_from.astimezone(MOSCOW_TZ)
+    return available_answer
 
-        available_answer = results_time <= now_moscow
 
-    return available_answer
+def load_section_dashboard(section_ids: List[int], user_id: int) -> dict:
+    dashboard = {
+        section_id: {
+            "sessions_count": 0,
+            "has_sessions": False,
+            "last_session_guid": None,
+            "last_correct_count": 0,
+            "has_unfinished": False,
+            "first_unanswered_id": None,
+        }
+        for section_id in section_ids
+    }
+    if not section_ids:
+        return dashboard
+
+    ranked_sessions = (
+        db.session.query(
+            QuizSession.id,
+            QuizSession.section_id,
+            QuizSession.guid,
+            QuizSession.finished_at,
+            func.count()
+            .over(partition_by=QuizSession.section_id)
+            .label("sessions_count"),
+            func.row_number()
+            .over(
+                partition_by=QuizSession.section_id,
+                order_by=QuizSession.finished_at.desc(),
+            )
+            .label("last_rank"),
+            func.row_number()
+            .over(
+                partition_by=(
+                    QuizSession.section_id,
+                    QuizSession.finished_at.is_(None),
+                ),
+                order_by=QuizSession.created_on.desc(),
+            )
+            .label("unfinished_rank"),
+        )
+        .filter(QuizSession.created_by_id == user_id)
+        .filter(QuizSession.section_id.in_(section_ids))
+        .subquery()
+    )
 
+    last_sessions = {}
+    unfinished_sessions = {}
 
-def to_section_dto_list(sections: List[Section]):
-    dto_list: List[SectionDto] = list(
-        map(
-            lambda our_section: SectionDto(
-                section_id=our_section.id,
-                section_name=our_section.name,
-                timer=our_section.timer,
-                description=our_section.description,
-                question_count=calculate_question_count(our_section),
-                is_exam=our_section.is_exam,
-                is_answer_available=is_answer_available(our_section),
-                results_available_from=our_section.results_available_from,
+    for row in db.session.query(ranked_sessions).filter(
+        or_(
+            ranked_sessions.c.last_rank == 1,
+            and_(
+                ranked_sessions.c.unfinished_rank == 1,
+                ranked_sessions.c.finished_at.is_(None),
             ),
-            sections,
         )
+    ):
+        section_dashboard = dashboard[row.section_id]
+        section_dashboard["sessions_count"] = row.sessions_count
+        if row.last_rank == 1:
+            section_dashboard["has_sessions"] = True
+            section_dashboard["last_session_guid"] = row.guid
+            last_sessions[row.id] = section_dashboard
+        if row.finished_at is None and row.unfinished_rank == 1:
+            section_dashboard["has_unfinished"] = True
+            unfinished_sessions[row.id] = section_dashboard
+
+    if last_sessions:
+        correct_counts = (
+            db.session.query(
+                SessionQuestion.quiz_session_id,
+                func.sum(case((SessionQuestion.is_correct.is_(True), 1), else_=0)),
+            )
+            .filter(SessionQuestion.quiz_session_id.in_(last_sessions))
+            .group_by(SessionQuestion.quiz_session_id)
+        )
+        for quiz_session_id, correct_count in correct_counts:
+            last_sessions[quiz_session_id]["last_correct_count"] = correct_count
+
+    if unfinished_sessions:
+        first_unanswered = (
+            db.session.query(
+                SessionQuestion.quiz_session_id, func.min(SessionQuestion.id)
+            )
+            .filter(SessionQuestion.quiz_session_id.in_(unfinished_sessions))
+            .filter(SessionQuestion.is_correct.is_(None))
+            .group_by(SessionQuestion.quiz_session_id)
+        )
+        for quiz_session_id, question_id in first_unanswered:
+            unfinished_sessions[quiz_session_id]["first_unanswered_id"] = question_id
+
+    return dashboard
+
+
+def to_section_dto_list(sections: List[Section]):
+    dashboard = load_section_dashboard(
+        [section.id for section in sections], current_user.id
     )
+    now_moscow = datetime.now(MOSCOW_TZ)
+    dto_list: List[SectionDto] = [
+        SectionDto.from_section(our_section, dashboard[our_section.id], now_moscow)
+        for our_section in sections
+    ]
     return dto_list
 
 
 def to_test_dto_list(tests: List[Test]):
-    dto_list: List[TestDto] = list(
-        map(
-            lambda our_test: TestDto(
-                test_id=our_test.id,
-                test_name=our_test.name,
-                author_name=our_test.created_by_user.nick,
-                description=our_test.description,
-                is_retakeable=our_test.is_retakeable,
-                is_ready=our_test.is_ready,
-                section_count=len(our_test.sections),
-            ),
-            tests,
+    dto_list: List[TestDto] = [
+        TestDto(
+            test_id=our_test.id,
+            test_name=our_test.name,
+            author_name=our_test.created_by_user.nick,
+            description=our_test.description,
+            is_retakeable=our_test.is_retakeable,
+            is_ready=our_test.is_ready,
+            section_count=len(our_test.sections),
         )
-    )
+        for our_test in tests
+    ]
 
     return dto_list
 
 
 def to_question_for_editor_dto_list(questions: List[Question]):
-    dto_list: List[QuestionForEditorDto] = list(
-        map(
-            lambda question: QuestionForEditorDto(
-                question_id=question.id, question_text=question.text
-            ),
-            questions,
-        )
-    )
+    dto_list: List[QuestionForEditorDto] = [
+        QuestionForEditorDto(question_id=question.id, question_text=question.text)
+        for question in questions
+    ]
 
     return dto_list
 
 
+@dataclass(slots=True)
 class PracticeAnswerResultDto:
-    def __init__(self, score: int, explanation: str, max_score: int, hints: list):
-        self.score = score
-        self.explanation = explanation
-        self.max_score = max_score
-        self.hints = hints
+    score: int
+    explanation: str
+    max_score: int
+    hints: list
 
     def to_dict(self):
         return {
@@ -116,110 +190,122 @@ class PracticeAnswerResultDto:
 
 
 def calculate_max_score(requirements: list) -> int:
-    def recursive_sum(data):
-        if isinstance(data, dict):
+    # Requirements come from JSON, so containers are plain dicts and lists
+    # and exact type checks are enough.
+    total = 0
+    stack = [requirements]
+    while stack:
+        data = stack.pop()
+        if type(data) is dict:
             points = data.get("points", 0)
-            valid_points = (
-                points if isinstance(points, (int, float)) and points > 0 else 0
-            )
-            return valid_points + sum(recursive_sum(value) for value in data.values())
-        elif isinstance(data, list):
-            return sum(recursive_sum(item) for item in data)
-        return 0
+            if isinstance(points, (int, float)) and points > 0:
+                total += points
+            stack.extend(data.values())
+        elif type(data) is list:
+            stack.extend(data)
 
-    return recursive_sum(requirements)
+    return total
 
 
+@dataclass(slots=True)
 class AnswerResultDto:
-    def __init__(self, explanation, is_correct: bool) -> None:
-        self.explanation = explanation
-        self.is_correct = is_correct
+    explanation: Any
+    is_correct: bool
 
     def to_dict(self):
-        if isinstance(self.explanation, list):
-            return {"explanation": [self.explanation], "is_correct": self.is_correct}
-        else:
-            return {"explanation": self.explanation, "is_correct": self.is_correct}
+        return {"explanation": self.explanation, "is_correct": self.is_correct}
 
 
 class AnswerDto:
     def __init__(self, question_type: str, answer: Answer) -> None:
-        if question_type == "matching":
+        self.is_matching = question_type == "matching"
+        if self.is_matching:
             self.left = answer.left
             self.right = answer.right
         else:
             self.variant = answer.variant
 
     def to_dict(self):
-        attributes = ["variant", "left", "right"]
-        data = {attr: getattr(self, attr) for attr in attributes if hasattr(self, attr)}
-        return data
+        if self.is_matching:
+            return {"left": self.left, "right": self.right}
+        return {"variant": self.variant}
+
+
+def _copy_start_network(session_question, practice_question, user_id) -> Network:
+    """Add a copy of the task start network to the session without committing.
+
+    The caller must commit the session once the DTO is built.
+    """
+    net = practice_question.start_network
+    net_copy = Network(
+        guid=str(uuid.uuid4()),
+        author_id=user_id,
+        network=net.network,
+        title=net.title,
+        description="Network copy",
+        preview_uri=net.preview_uri,
+        is_task=True,
+    )
+    db.session.add(net_copy)
+    session_question.network_guid = net_copy.guid
+    return net_copy
 
 
 class PracticeQuestionDto:
     def __init__(self, user_id, practice_question, session_question_id: str) -> None:
-        attributes = [
-            "description",
-            "available_host",
-            "available_l1_hub",
-            "available_server",
-            "available_l2_switch",
-            "available_l3_router",
-        ]
-
-        for attribute in attributes:
-            setattr(self, attribute, getattr(practice_question, attribute))
-
-        session_question = SessionQuestion.query.filter_by(
-            id=session_question_id
-        ).first()
+        self.description = practice_question.description
+        self.available_host = practice_question.available_host
+        self.available_l1_hub = practice_question.available_l1_hub
+        self.available_server = practice_question.available_server
+        self.available_l2_switch = practice_question.available_l2_switch
+        self.available_l3_router = practice_question.available_l3_router
+
+        session_question: Optional[SessionQuestion] = db.session.get(
+            SessionQuestion, session_question_id
+        )
+        if session_question is None:
+            raise ValueError(f"Вопрос сессии {session_question_id} не найден.")
 
+        start_configuration = None
         if session_question.network_guid:
-            net_copy = Network.query.filter_by(
-                guid=session_question.network_guid
-            ).first()
-        else:
-            net = Network.query.filter(
-                Network.guid == practice_question.start_configuration
-            ).first()
-
-            u = uuid.uuid4()
-            net_copy = Network(
-                guid=str(u),
-                author_id=user_id,
-                network=net.network,
-                title=net.title,
-                description="Network copy",
-                preview_uri=net.preview_uri,
-                is_task=True,
+            # Repeated views only need the stored network text, so skip
+            # building a full Network instance for it.
+            start_configuration = (
+                db.session.query(Network.network)
+                .filter(Network.guid == session_question.network_guid)
+                .limit(1)
+                .scalar()
             )
-            db.session.add(net_copy)
-
-            session_question.network_guid = net_copy.guid
-            db.session.commit()
 
-        escaped_string = net_copy.network.replace('\\"', '"').replace('"', '\\"')
-        self.start_configuration = escaped_string
-        self.network_guid = net_copy.guid
+        if start_configuration is None:
+            # No copy yet, or the user has deleted it: make a fresh one.
+            net_copy = _copy_start_network(session_question, practice_question, user_id)
+            self.start_configuration = net_copy.network
+            self.network_guid = net_copy.guid
+        else:
+            self.start_configuration = start_configuration
+            self.network_guid = session_question.network_guid
 
     def to_dict(self):
-        attributes = [
-            "description",
-            "available_host",
-            "available_l1_hub",
-            "available_server",
-            "available_l2_switch",
-            "available_l3_router",
-            "start_configuration",
-            "network_guid",
-        ]
+        return {
+            "description": self.description,
+            "available_host": self.available_host,
+            "available_l1_hub": self.available_l1_hub,
+            "available_server": self.available_server,
+            "available_l2_switch": self.available_l2_switch,
+            "available_l3_router": self.available_l3_router,
+            "start_configuration": self.start_configuration,
+            "network_guid": self.network_guid,
+        }
 
-        return {attribute: str(getattr(self, attribute)) for attribute in attributes}
+
+QUESTION_TYPES = ("practice", "variable", "sorting", "matching")
 
 
 def get_question_type(question_type: int):
-    types = {0: "practice", 1: "variable", 2: "sorting", 3: "matching"}
-    return types.get(question_type, "")
+    if 0 <= question_type < len(QUESTION_TYPES):
+        return QUESTION_TYPES[question_type]
+    return ""
 
 
 class QuestionDto:
@@ -236,18 +322,21 @@ class QuestionDto:
             ).to_dict()
             return
 
-        filtered_answers = Answer.query.filter_by(
-            question_id=question.id, is_deleted=False
-        ).all()
+        filtered_answers = [
+            answer
+            for answer in question.answers  # type: ignore[attr-defined]
+            if not answer.is_deleted
+        ]
 
         if self.question_type == "variable":
-            self.correct_count = sum(answer.is_correct for answer in filtered_answers)
+            self.correct_count = sum(
+                1 for answer in filtered_answers if answer.is_correct
+            )
 
         self.answers = [
             AnswerDto(question_type=self.question_type, answer=answer).to_dict()
-            for answer in filtered_answers
+            for answer in random.sample(filtered_answers, len(filtered_answers))
         ]
-        random.shuffle(self.answers)
 
         # text_question = question.text_question
         # self.text_type = text_question.text_type
@@ -279,118 +368,114 @@ class QuestionDto:
         #     self.answers = " ".join(words)
 
 
+@dataclass(slots=True)
 class SectionDto:
-    def __init__(
-        self,
-        section_id: str,
-        section_name: str,
-        timer: str,
-        description: str,
-        question_count: int,
-        is_exam: bool,
-        is_answer_available: bool,
-        results_available_from,
-    ):
-        self.section_id = section_id
-        self.section_name = section_name
-        self.timer = timer
-        self.description = description
-        self.question_count = question_count
-        self.is_exam = is_exam
-        self.answer_available = is_answer_available
-        self.results_available_from = results_available_from
-
-        current_user_sessions = QuizSession.query.filter(
-            QuizSession.created_by_id == current_user.id
-        ).filter(QuizSession.section_id == section_id)
-
-        self.sessions_count = current_user_sessions.count()
-
-        session = current_user_sessions.order_by(QuizSession.finished_at.desc()).first()
-        if session:
-            self.last_correct_count = sum(
-                1 for question in session.sessions if question.is_correct
-            )
-            if session.guid:
-                self.session_guid = session.guid
-
-        section = Section.query.get(section_id)
-        test = section.test
+    section_id: str
+    section_name: str
+    timer: str
+    description: str
+    question_count: int
+    is_exam: bool
+    answer_available: bool
+    results_available_from: Optional[datetime]
+    sessions_count: int
+    there_is_unfinished: bool
+    last_correct_count: Optional[int] = None
+    session_guid: Optional[str] = None
+    last_question: Optional[int] = None
+
+    @classmethod
+    def from_section(cls, section: Section, dashboard: dict, now_moscow: datetime):
+        there_is_unfinished = bool(
+            dashboard["has_unfinished"]
+            and section.is_exam
+            and not section.test.is_retakeable
+        )
 
-        unfinished_session = (
-            current_user_sessions.filter(QuizSession.finished_at.is_(None))
-            .order_by(QuizSession.created_on.desc())
-            .first()
+        dto = cls(
+            section_id=section.id,
+            section_name=section.name,
+            timer=section.timer,
+            description=section.description,
+            question_count=calculate_question_count(section),
+            is_exam=section.is_exam,
+            answer_available=is_answer_available(section, now_moscow),
+            results_available_from=section.results_available_from,
+            sessions_count=dashboard["sessions_count"],
+            there_is_unfinished=there_is_unfinished,
         )
 
-        self.there_is_unfinished = False
+        if dashboard["has_sessions"]:
+            dto.last_correct_count = dashboard["last_correct_count"]
+            dto.session_guid = dashboard["last_session_guid"] or None
 
-        if unfinished_session and is_exam and not test.is_retakeable:
-            self.there_is_unfinished = True
+        if there_is_unfinished:
+            dto.last_question = dashboard["first_unanswered_id"]
 
-            unanswered = (
-                SessionQuestion.query.filter_by(quiz_session_id=unfinished_session.id)
-                .filter(SessionQuestion.is_correct.is_(None))
-                .order_by(SessionQuestion.id.asc())
-                .first()
-            )
+        return dto
 
-            if unanswered:
-                self.last_question = unanswered.id
+    def to_dict(self):
+        return {
+            "section_id": self.section_id,
+            "section_name": self.section_name,
+            "timer": self.timer,
+            "description": self.description,
+            "question_count": self.question_count,
+            "is_exam": self.is_exam,
+            "answer_available": self.answer_available,
+            "results_available_from": self.results_available_from,
+            "sessions_count": self.sessions_count,
+            "there_is_unfinished": self.there_is_unfinished,
+            "last_correct_count": self.last_correct_count,
+            "session_guid": self.session_guid,
+            "last_question": self.last_question,
+        }
 
 
+@dataclass(slots=True)
 class TestDto:
-    def __init__(
-        self,
-        test_id: str,
-        test_name: str,
-        author_name: str,
-        description: str,
-        is_retakeable: bool,
-        is_ready: bool,
-        section_count: int,
-    ):
-        self.test_id = test_id
-        self.test_name = test_name
-        self.author_name = author_name
-        self.description = description
-        self.is_retakeable = is_retakeable
-        self.is_ready = is_ready
-        self.section_count = section_count
+    test_id: str
+    test_name: str
+    author_name: str
+    description: str
+    is_retakeable: bool
+    is_ready: bool
+    section_count: int
+
+    def to_dict(self):
+        return {
+            "test_id": self.test_id,
+            "test_name": self.test_name,
+            "author_name": self.author_name,
+            "description": self.description,
+            "is_retakeable": self.is_retakeable,
+            "is_ready": self.is_ready,
+            "section_count": self.section_count,
+        }
 
 
+@dataclass(slots=True)
 class QuestionForEditorDto:
-    def __init__(self, question_id: str, question_text: str):
-        self.question_id = question_id
-        self.question_text = question_text
+    question_id: str
+    question_text: str
+
+    def to_dict(self):
+        return {"question_id": self.question_id, "question_text": self.question_text}
 
 
+@dataclass(slots=True)
 class SessionResultDto:
-    def __init__(
-        self,
-        test_name: str,
-        section_name: str,
-        theory_correct: int,
-        theory_count: int,
-        practice_results: list,
-        results: list,  # Добавили поле для списка вопросов
-        start_time: str,
-        time_spent: str,
-        is_exam: bool,
-        answer_available: bool,
-        available_from,
-    ):
-        self.test_name = test_name
-        self.section_name = section_name
-        self.theory_correct = theory_correct
-        self.theory_count = theory_count
-        self.practice_results = practice_results
-        self.results = results
-        self.start_time = start_time
-        self.time_spent = time_spent
-        self.is_exam = is_exam
-        self.answer_available = answer_available
-        self.available_from = available_from
+    test_name: str
+    section_name: str
+    theory_correct: int
+    theory_count: int
+    practice_results: list
+    results: list  # Добавили поле для списка вопросов
+    start_time: str
+    time_spent: str
+    is_exam: bool
+    answer_available: bool
+    available_from: Optional[datetime]
 
     def to_dict(self):
         return {
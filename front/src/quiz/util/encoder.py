@@ -1,6 +1,9 @@
 import json
 from uuid import UUID
 
+import orjson
+from flask.json.provider import DefaultJSONProvider
+
 
 class UUIDEncoder(json.JSONEncoder):
     def default(self, obj):
@@ -8,3 +11,19 @@ class UUIDEncoder(json.JSONEncoder):
             return obj.hex
 
         return json.JSONEncoder.default(self, obj)
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    # Datetimes are passed through to the default provider so they keep
+    # Flask's HTTP date format. Keyword arguments to dumps/loads (such as the
+    # indent Flask passes for pretty-printed debug responses) are ignored, so
+    # output is always compact.
+    option = (
+        orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+    )
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=self.option).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
@@ -0,0 +1,155 @@
+import pytest
+from flask import Flask
+from sqlalchemy import event
+from sqlalchemy.orm import Session, defaultload, raiseload
+
+from miminet_model import Network, User, db
+from quiz.entity.entity import (
+    Answer,
+    PracticeQuestion,
+    Question,
+    QuestionImage,
+    QuizSession,
+    Section,
+    SessionQuestion,
+)
+from quiz.service.session_question_service import get_question_by_session_question_id
+
+
+@pytest.fixture
+def app():
+    app = Flask(__name__)
+    app.config["TESTING"] = True
+    app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite://"
+    db.init_app(app)
+
+    with app.app_context():
+        db.create_all()
+        yield app
+
+
+@pytest.fixture
+def raise_on_question_lazy_load(app):
+    # Any relationship of a loaded Question that is not covered by an eager
+    # option raises instead of issuing its own SELECT. The template network is
+    # lazy on purpose: it is only read when a copy is created.
+    def add_raiseload(orm_execute_state):
+        if (
+            orm_execute_state.is_select
+            and not orm_execute_state.is_relationship_load
+            and Question in [m.class_ for m in orm_execute_state.all_mappers]
+        ):
+            orm_execute_state.statement = orm_execute_state.statement.options(
+                raiseload("*"),
+                defaultload(Question.practice_question).lazyload(
+                    PracticeQuestion.start_network
+                ),
+            )
+
+    event.listen(Session, "do_orm_execute", add_raiseload)
+    yield
+    event.remove(Session, "do_orm_execute", add_raiseload)
+
+
+@pytest.fixture
+def user(app):
+    user = User(nick="student")
+    db.session.add(user)
+    db.session.commit()
+    return user
+
+
+def add_session_question(user, question):
+    section = Section(name="section")
+    db.session.add(section)
+    db.session.flush()
+
+    quiz_session = QuizSession(section_id=section.id, created_by_id=user.id)
+    db.session.add(quiz_session)
+    db.session.flush()
+
+    session_question = SessionQuestion(
+        quiz_session_id=quiz_session.id,
+        question_id=question.id,
+        created_by_id=user.id,
+    )
+    db.session.add(session_question)
+    db.session.commit()
+
+    session_question_id = session_question.id
+    db.session.expunge_all()
+    return session_question_id
+
+
+def test_variable_question_uses_eager_loads(user, raise_on_question_lazy_load):
+    question = Question(text="question", question_type=1)
+    db.session.add(question)
+    db.session.flush()
+    db.session.add_all(
+        [
+            Answer(question_id=question.id, variant="a", is_correct=True),
+            Answer(question_id=question.id, variant="b", is_correct=False),
+            Answer(
+                question_id=question.id,
+                variant="deleted",
+                is_correct=True,
+                is_deleted=True,
+            ),
+            QuestionImage(question_id=question.id, file_path="image.png"),
+        ]
+    )
+    session_question_id = add_session_question(user, question)
+
+    question_dto, *_, status = get_question_by_session_question_id(session_question_id)
+
+    assert status == 200
+    assert question_dto.images == ["image.png"]
+    assert question_dto.correct_count == 1
+    assert sorted(answer["variant"] for answer in question_dto.answers) == ["a", "b"]
+
+
+def test_practice_question_uses_eager_loads(user, raise_on_question_lazy_load):
+    network = Network(guid="start", author_id=user.id, network='{"nodes": []}')
+    question = Question(text="practice", question_type=0)
+    db.session.add_all([network, question])
+    db.session.flush()
+    db.session.add(
+        PracticeQuestion(id=question.id, start_configuration="start", available_host=2)
+    )
+    session_question_id = add_session_question(user, question)
+
+    for _ in range(2):
+        question_dto, *_, status = get_question_by_session_question_id(
+            session_question_id
+        )
+        db.session.expunge_all()
+
+        assert status == 200
+        assert question_dto.images == []
+        assert question_dto.practice_question["start_configuration"] == '{"nodes": []}'
+        assert question_dto.practice_question["available_host"] == 2
+
+    assert Network.query.count() == 2
+
+
+def test_practice_question_recreates_deleted_network_copy(user):
+    network = Network(guid="start", author_id=user.id, network='{"nodes": []}')
+    question = Question(text="practice", question_type=0)
+    db.session.add_all([network, question])
+    db.session.flush()
+    db.session.add(PracticeQuestion(id=question.id, start_configuration="start"))
+    session_question_id = add_session_question(user, question)
+
+    first_dto = get_question_by_session_question_id(session_question_id)[0]
+    first_guid = first_dto.practice_question["network_guid"]
+    Network.query.filter_by(guid=first_guid).delete()
+    db.session.commit()
+    db.session.expunge_all()
+
+    question_dto = get_question_by_session_question_id(session_question_id)[0]
+
+    assert question_dto.practice_question["start_configuration"] == '{"nodes": []}'
+    assert question_dto.practice_question["network_guid"] != first_guid
+    assert db.session.get(SessionQuestion, session_question_id).network_guid == (
+        question_dto.practice_question["network_guid"]
+    )
@@ -0,0 +1,195 @@
+import random
+from datetime import datetime, timedelta
+
+import pytest
+from flask import Flask
+
+from miminet_model import User, db
+from quiz.entity.entity import QuizSession, Section, SessionQuestion
+from quiz.entity.entity import Test as QuizTest
+from quiz.util.dto import load_section_dashboard
+
+START = datetime(2024, 1, 1)
+
+
+@pytest.fixture
+def app():
+    app = Flask(__name__)
+    app.config["TESTING"] = True
+    app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite://"
+    db.init_app(app)
+
+    with app.app_context():
+        db.create_all()
+        yield app
+
+
+@pytest.fixture
+def users(app):
+    user, other_user = User(nick="student"), User(nick="other")
+    db.session.add_all([user, other_user])
+    db.session.commit()
+    return user, other_user
+
+
+@pytest.fixture
+def quiz_test(app):
+    quiz_test = QuizTest(name="test")
+    db.session.add(quiz_test)
+    db.session.commit()
+    return quiz_test
+
+
+def add_section(quiz_test):
+    section = Section(name="section", test=quiz_test, is_exam=True)
+    db.session.add(section)
+    db.session.flush()
+    return section
+
+
+def add_session(section, user, minute, finished, answers):
+    created_on = START + timedelta(minutes=minute)
+    quiz_session = QuizSession(
+        section_id=section.id,
+        created_by_id=user.id,
+        created_on=created_on,
+        finished_at=created_on + timedelta(seconds=30) if finished else None,
+    )
+    db.session.add(quiz_session)
+    db.session.flush()
+    for is_correct in answers:
+        db.session.add(
+            SessionQuestion(
+                quiz_session_id=quiz_session.id,
+                created_by_id=user.id,
+                is_correct=is_correct,
+            )
+        )
+    db.session.flush()
+    return quiz_session
+
+
+def per_section_dashboard(section_id, user_id):
+    # The per-section queries SectionDto used to run.
+    user_sessions = QuizSession.query.filter(
+        QuizSession.created_by_id == user_id
+    ).filter(QuizSession.section_id == section_id)
+
+    last_session = user_sessions.order_by(QuizSession.finished_at.desc()).first()
+    unfinished_session = (
+        user_sessions.filter(QuizSession.finished_at.is_(None))
+        .order_by(QuizSession.created_on.desc())
+        .first()
+    )
+    unanswered = None
+    if unfinished_session:
+        unanswered = (
+            SessionQuestion.query.filter_by(quiz_session_id=unfinished_session.id)
+            .filter(SessionQuestion.is_correct.is_(None))
+            .order_by(SessionQuestion.id.asc())
+            .first()
+        )
+
+    return {
+        "sessions_count": user_sessions.count(),
+        "has_sessions": last_session is not None,
+        "last_session_guid": last_session.guid if last_session else None,
+        "last_correct_count": (
+            sum(1 for question in last_session.sessions if question.is_correct)
+            if last_session
+            else 0
+        ),
+        "has_unfinished": unfinished_session is not None,
+        "first_unanswered_id": unanswered.id if unanswered else None,
+    }
+
+
+def assert_matches_per_section(sections, user):
+    section_ids = [section.id for section in sections]
+    dashboard = load_section_dashboard(section_ids, user.id)
+
+    assert set(dashboard) == set(section_ids)
+    for section_id in section_ids:
+        assert dashboard[section_id] == per_section_dashboard(section_id, user.id)
+
+
+def test_empty_section_list(app, users):
+    assert load_section_dashboard([], users[0].id) == {}
+
+
+def test_dashboard_cases(app, users, quiz_test):
+    user, other_user = users
+
+    no_sessions = add_section(quiz_test)
+
+    several_finished = add_section(quiz_test)
+    add_session(several_finished, user, 1, True, [True, False, True])
+    add_session(several_finished, user, 2, True, [False, True])
+    add_session(several_finished, user, 3, True, [True, True, None])
+
+    unfinished_with_unanswered = add_section(quiz_test)
+    add_session(unfinished_with_unanswered, user, 4, True, [True])
+    add_session(unfinished_with_unanswered, user, 5, False, [True, None, None])
+
+    unfinished_all_answered = add_section(quiz_test)
+    add_session(unfinished_all_answered, user, 6, False, [True, False])
+
+    empty_last_session = add_section(quiz_test)
+    add_session(empty_last_session, user, 7, True, [True, True])
+    add_session(empty_last_session, user, 8, True, [])
+
+    other_users_section = add_section(quiz_test)
+    add_session(other_users_section, other_user, 9, False, [None])
+    add_session(several_finished, other_user, 10, True, [True])
+
+    db.session.commit()
+
+    sections = [
+        no_sessions,
+        several_finished,
+        unfinished_with_unanswered,
+        unfinished_all_answered,
+        empty_last_session,
+        other_users_section,
+    ]
+    assert_matches_per_section(sections, user)
+
+    dashboard = load_section_dashboard([section.id for section in sections], user.id)
+    assert dashboard[no_sessions.id]["has_sessions"] is False
+    assert dashboard[several_finished.id]["sessions_count"] == 3
+    assert dashboard[several_finished.id]["last_correct_count"] == 2
+    assert dashboard[unfinished_with_unanswered.id]["first_unanswered_id"]
+    assert dashboard[unfinished_all_answered.id]["has_unfinished"] is True
+    assert dashboard[unfinished_all_answered.id]["first_unanswered_id"] is None
+    assert dashboard[empty_last_session.id]["last_correct_count"] == 0
+    assert dashboard[other_users_section.id]["sessions_count"] == 0
+
+
+def test_dashboard_matches_per_section_queries_on_random_data(app, users, quiz_test):
+    rng = random.Random(0)
+    user, other_user = users
+    minute = 0
+    sections = []
+
+    for _ in range(30):
+        section = add_section(quiz_test)
+        sections.append(section)
+
+        session_count = rng.randint(0, 4)
+        # At most one unfinished session per section, so both implementations
+        # pick the same "last" and "unfinished" session without ties.
+        unfinished_index = rng.randrange(session_count + 1)
+        for index in range(session_count):
+            minute += 1
+            add_session(
+                section,
+                rng.choice([user, user, other_user]),
+                minute,
+                index != unfinished_index,
+                [rng.choice([True, False, None]) for _ in range(rng.randint(0, 4))],
+            )
+
+    db.session.commit()
+
+    assert_matches_per_section(sections, user)
+    assert_matches_per_section(sections, other_user)